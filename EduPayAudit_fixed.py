@@ -233,11 +233,25 @@ plt.show()
 # 
 # Let's analyze the relationship between employment status and payroll status.
 
-# Merge HR and Payroll data on EmployeeID
-merged_data = pd.merge(hr_data, payroll_data, on='EmployeeID', how='inner', suffixes=('_HR', '_Payroll'))
-
-# Create a crosstab of employment status vs. payroll status
-status_crosstab = pd.crosstab(merged_data['EmploymentStatus'], merged_data['PayrollStatus'])
+# Reuse the auditor's HR/Payroll join, keeping only employees present in both systems
+merged_data = auditor.merged.dropna(subset=['EmploymentStatus', 'PayrollStatus'])
+
+# Create a crosstab of employment status vs. payroll status by counting
+# (employment, payroll) code pairs in a single np.bincount pass. Statuses that only
+# occur on unmatched records are dropped so they don't show up as empty rows/columns
+employment_status = merged_data['EmploymentStatus'].astype('category').cat.remove_unused_categories()
+payroll_status = merged_data['PayrollStatus'].astype('category').cat.remove_unused_categories()
+es_codes = employment_status.cat.codes.to_numpy()
+ps_codes = payroll_status.cat.codes.to_numpy()
+n_es = len(employment_status.cat.categories)
+n_ps = len(payroll_status.cat.categories)
+valid = (es_codes >= 0) & (ps_codes >= 0)
+counts = np.bincount(es_codes[valid] * n_ps + ps_codes[valid], minlength=n_es * n_ps).reshape(n_es, n_ps)
+status_crosstab = pd.DataFrame(
+    counts,
+    index=pd.Index(employment_status.cat.categories, name='EmploymentStatus'),
+    columns=pd.Index(payroll_status.cat.categories, name='PayrollStatus')
+)
 
 # Display the crosstab
 print("Employment Status vs. Payroll Status:")
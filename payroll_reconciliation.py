@@ -9,12 +9,28 @@ When using this software or substantial portions of it, you must include the fol
 See the LICENSE file for full details.
 """
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
 import sys
+import os
+import tempfile
+import importlib.util
 from datetime import datetime
 import logging
 from pathlib import Path
 import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Optional accelerators are only located here and imported by the code paths that
+# use them, so runs on the default pandas path don't pay their import cost
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+POLARS_AVAILABLE = importlib.util.find_spec("polars") is not None
+CUDF_AVAILABLE = importlib.util.find_spec("cudf") is not None
 
 # Set up logging
 logging.basicConfig(
@@ -26,6 +42,339 @@ logging.basicConfig(
     ]
 )
 
+# Columns every input file must provide
+REQUIRED_COLUMNS = ["EmployeeID", "Pay", "Position", "Department", "PayPeriodEnd"]
+
+# Explicit column types for the PyArrow CSV reader so no type inference is needed.
+# EmployeeID values are alphanumeric (e.g. "FAC001"), so they are read as strings.
+# Low-cardinality text columns are dictionary-encoded and arrive in pandas as
+# categoricals; the status columns are optional and only applied when present.
+CSV_COLUMN_TYPES = {
+    "EmployeeID": pa.string(),
+    "Pay": pa.float64(),
+    "PayPeriodEnd": pa.timestamp("ns"),
+    "Department": pa.dictionary(pa.int32(), pa.string()),
+    "Position": pa.dictionary(pa.int32(), pa.string()),
+    "EmploymentStatus": pa.dictionary(pa.int32(), pa.string()),
+    "PayrollStatus": pa.dictionary(pa.int32(), pa.string())
+}
+
+# Recorded with each cached Arrow table so a change to the column types invalidates it
+CSV_SCHEMA_FINGERPRINT = hashlib.sha1(
+    json.dumps({col: str(dtype) for col, dtype in CSV_COLUMN_TYPES.items()}, sort_keys=True).encode()
+).hexdigest()
+
+# Reconciliation engines accepted by PayrollAuditor
+BACKENDS = ("pandas", "polars")
+
+# Reconciliation modes accepted by perform_reconciliation
+RECONCILIATION_MODES = ("full", "summary")
+
+# Merges smaller than this stay on the NumPy path, where the JIT compile cost would dominate
+NUMBA_MIN_ROWS = 1_000_000
+
+# Largest cent amount stored as int32, leaving headroom so the difference of two
+# amounts also fits (about $10.7M per record); larger amounts fall back to int64
+INT32_CENTS_LIMIT = np.iinfo(np.int32).max // 2
+
+
+def _validate(columns, name):
+    """
+    Check that an input file provides every required column.
+    
+    Args:
+        columns (iterable): Column names read from the file
+        name (str): System the file came from, used in the error message
+        
+    Raises:
+        ValueError: If any of REQUIRED_COLUMNS is missing
+    """
+    missing_cols = [col for col in REQUIRED_COLUMNS if col not in columns]
+    if missing_cols:
+        raise ValueError(f"Missing required columns in {name} data: {missing_cols}")
+
+
+def _to_cents(pay):
+    """
+    Convert dollar amounts to whole cents so pay can be compared exactly.
+    
+    Cents are stored as int32 whenever every amount is within INT32_CENTS_LIMIT,
+    which halves the memory traffic of the comparison pass that follows.
+    
+    Args:
+        pay (numpy.ndarray): Pay amounts in dollars; NaN entries become 0
+        
+    Returns:
+        numpy.ndarray: Pay amounts as int32 or int64 cents
+    """
+    cents = np.rint(np.nan_to_num(pay) * 100)
+    if cents.size == 0 or (cents.min() >= -INT32_CENTS_LIMIT and cents.max() <= INT32_CENTS_LIMIT):
+        return cents.astype(np.int32)
+    return cents.astype(np.int64)
+
+
+def _reconcile_pay_numpy(pay):
+    """
+    Compare HR and Payroll pay with vectorized NumPy operations.
+    
+    Pay is compared as integer cents, so any difference of a cent or more is a
+    mismatch and the total discrepancy is exact. A single null mask covers both
+    pay columns and every result is derived from it.
+    
+    Args:
+        pay (numpy.ndarray): Array of shape (n, 2) with HR pay in column 0 and Payroll
+            pay in column 1, NaN where the record is missing from that system
+        
+    Returns:
+        tuple: (mismatch_mask, hr_missing, payroll_missing, abs_diff_cents, total_discrepancy)
+    """
+    missing = np.isnan(pay)
+    cents = _to_cents(pay)
+    # The mismatch test needs no abs: a signed integer difference is non-zero
+    # exactly when its magnitude is, so abs is applied in place afterwards
+    diff_cents = cents[:, 0] - cents[:, 1]
+    diff_cents[missing.any(axis=1)] = 0
+    mismatch_mask = diff_cents != 0
+    abs_diff_cents = np.abs(diff_cents, out=diff_cents)
+    return mismatch_mask, missing[:, 0], missing[:, 1], abs_diff_cents, abs_diff_cents.sum(dtype=np.int64) / 100.0
+
+
+def _cuda_available():
+    """
+    Check whether cuDF can be imported and has a usable CUDA device.
+    
+    cuDF validates the CUDA driver and device when it is imported, so a failed
+    import also covers machines with the package installed but no usable GPU.
+    
+    Returns:
+        bool: True if the cuDF backend can be used
+    """
+    if not CUDF_AVAILABLE:
+        return False
+    try:
+        import cudf  # noqa: F401
+        return True
+    except Exception:
+        return False
+
+
+@lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    Import numba and compile the fused reconciliation kernel on first use.
+    
+    Returns:
+        function: Numba kernel with the same inputs and outputs as _reconcile_pay_numpy
+    """
+    from numba import njit, prange
+    
+    # fastmath is restricted to flags that keep NaN semantics, since NaN marks a missing
+    # record, and leaves out arcp so total_cents / 100.0 stays an exact division
+    @njit(parallel=True, cache=True, fastmath={"nsz", "contract", "afn", "reassoc"})
+    def _reconcile_pay_numba(pay):
+        """
+        Compare HR and Payroll pay in a single fused parallel loop.
+        
+        Same inputs and outputs as _reconcile_pay_numpy, without intermediate arrays.
+        """
+        n = pay.shape[0]
+        mismatch_mask = np.zeros(n, dtype=np.bool_)
+        hr_missing = np.zeros(n, dtype=np.bool_)
+        payroll_missing = np.zeros(n, dtype=np.bool_)
+        abs_diff_cents = np.zeros(n, dtype=np.int64)
+        total_cents = 0
+        for i in prange(n):
+            hr_nan = np.isnan(pay[i, 0])
+            payroll_nan = np.isnan(pay[i, 1])
+            hr_missing[i] = hr_nan
+            payroll_missing[i] = payroll_nan
+            if not hr_nan and not payroll_nan:
+                diff = np.int64(np.rint(pay[i, 0] * 100)) - np.int64(np.rint(pay[i, 1] * 100))
+                if diff != 0:
+                    diff = abs(diff)
+                    abs_diff_cents[i] = diff
+                    mismatch_mask[i] = True
+                    total_cents += diff
+        return mismatch_mask, hr_missing, payroll_missing, abs_diff_cents, total_cents / 100.0
+    
+    return _reconcile_pay_numba
+
+
+def _reconcile_pay(pay):
+    """
+    Compare HR and Payroll pay, using the Numba kernel for very large merges.
+    
+    Args:
+        pay (numpy.ndarray): Array of shape (n, 2) with HR pay in column 0 and Payroll
+            pay in column 1, NaN where the record is missing from that system
+        
+    Returns:
+        tuple: (mismatch_mask, hr_missing, payroll_missing, abs_diff_cents, total_discrepancy)
+    """
+    if NUMBA_AVAILABLE and len(pay) >= NUMBA_MIN_ROWS:
+        return _numba_kernel()(np.ascontiguousarray(pay))
+    return _reconcile_pay_numpy(pay)
+
+
+def _department_analysis(departments, hr_pay, payroll_pay):
+    """
+    Sum HR and Payroll pay per HR department.
+    
+    Sorts the department category codes once and sums each contiguous run with
+    np.add.reduceat instead of a hash-based groupby. Totals are summed in whole
+    cents, like _department_discrepancy_count, so a department whose pay agrees
+    has a Discrepancy of exactly zero. Records without an HR department are
+    skipped and missing pay counts as zero.
+    
+    Args:
+        departments (pandas.Series): HR department of each record
+        hr_pay (numpy.ndarray): HR pay amounts aligned with departments
+        payroll_pay (numpy.ndarray): Payroll pay amounts aligned with departments
+        
+    Returns:
+        pandas.DataFrame: Department_HR, EmployeeID (record count), Pay_HR, Pay_Payroll and Discrepancy
+    """
+    # Sorted categories keep the department rows in alphabetical order
+    departments = departments.astype("category")
+    departments = departments.cat.reorder_categories(departments.cat.categories.sort_values())
+    codes = departments.cat.codes.to_numpy()
+    with_dept = np.flatnonzero(codes >= 0)
+    order = with_dept[np.argsort(codes[with_dept], kind="stable")]
+    codes_sorted = codes[order]
+    if len(codes_sorted):
+        boundaries = np.concatenate(([0], np.flatnonzero(np.diff(codes_sorted)) + 1))
+    else:
+        boundaries = np.zeros(0, dtype=np.intp)
+    
+    dept_cents_hr = np.add.reduceat(_to_cents(hr_pay[order]), boundaries, dtype=np.int64)
+    dept_cents_payroll = np.add.reduceat(_to_cents(payroll_pay[order]), boundaries, dtype=np.int64)
+    
+    return pd.DataFrame({
+        "Department_HR": departments.cat.categories[codes_sorted[boundaries]],
+        "EmployeeID": np.diff(np.append(boundaries, len(codes_sorted))).astype(np.int32),
+        "Pay_HR": dept_cents_hr / 100.0,
+        "Pay_Payroll": dept_cents_payroll / 100.0,
+        "Discrepancy": np.abs(dept_cents_hr - dept_cents_payroll) / 100.0
+    })
+
+
+def _department_discrepancy_count(departments, hr_pay, payroll_pay):
+    """
+    Count HR departments whose HR and Payroll pay totals differ.
+    
+    Summary-only counterpart of _department_analysis: per-department totals come
+    from two weighted np.bincount passes over the category codes, with no sort or
+    DataFrame. Totals are summed in cents so equal departments compare exactly.
+    
+    Args:
+        departments (pandas.Series): HR department of each record
+        hr_pay (numpy.ndarray): HR pay amounts aligned with departments
+        payroll_pay (numpy.ndarray): Payroll pay amounts aligned with departments
+        
+    Returns:
+        int: Number of departments with a non-zero pay discrepancy
+    """
+    departments = departments.astype("category")
+    codes = departments.cat.codes.to_numpy()
+    with_dept = codes >= 0
+    n_departments = len(departments.cat.categories)
+    hr_totals = np.bincount(codes[with_dept], weights=_to_cents(hr_pay[with_dept]), minlength=n_departments)
+    payroll_totals = np.bincount(codes[with_dept], weights=_to_cents(payroll_pay[with_dept]), minlength=n_departments)
+    return int(np.count_nonzero(hr_totals != payroll_totals))
+
+
+def _read_csv_cached(path, read_options, convert_options):
+    """
+    Read a CSV file with PyArrow, reusing a cached Arrow IPC copy when it is current.
+    
+    The parsed table is stored uncompressed as Feather v2 (Arrow IPC) in <path>.arrow
+    with the CSV's modification time, size and column-type fingerprint recorded in
+    <path>.arrow.meta. Later runs on an unchanged CSV memory-map the cached table and
+    skip CSV parsing entirely. The table is cached sorted by EmployeeID, so those runs
+    also take the monotonic fast path in _index_by_employee. Both files are written
+    under temporary names and renamed into place, so a run that has the old table
+    mapped never sees it truncated.
+    
+    Args:
+        path (str): Path to the CSV file
+        read_options (pyarrow.csv.ReadOptions): Options for a fresh CSV read
+        convert_options (pyarrow.csv.ConvertOptions): Column types for a fresh CSV read
+        
+    Returns:
+        pyarrow.Table: The parsed CSV data
+    """
+    path = Path(path)
+    cache_file = path.with_name(f"{path.name}.arrow")
+    meta_file = path.with_name(f"{path.name}.arrow.meta")
+    stat = path.stat()
+    key = {"mtime": stat.st_mtime, "size": stat.st_size, "schema": CSV_SCHEMA_FINGERPRINT}
+    
+    try:
+        if cache_file.exists() and json.loads(meta_file.read_text()) == key:
+            return feather.read_table(cache_file, memory_map=True)
+    except (OSError, ValueError) as e:
+        logging.warning(f"Ignoring unreadable cache for {path}: {str(e)}")
+        
+    table = pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+    if "EmployeeID" in table.column_names:
+        table = table.sort_by("EmployeeID")
+    temp_files = []
+    try:
+        fd, temp_cache = tempfile.mkstemp(dir=path.parent, prefix=f".{cache_file.name}.", suffix=".tmp")
+        os.close(fd)
+        temp_files.append(temp_cache)
+        feather.write_feather(table, temp_cache, compression="uncompressed")
+        
+        fd, temp_meta = tempfile.mkstemp(dir=path.parent, prefix=f".{meta_file.name}.", suffix=".tmp")
+        temp_files.append(temp_meta)
+        with os.fdopen(fd, "w") as f:
+            f.write(json.dumps(key))
+            
+        os.replace(temp_cache, cache_file)
+        os.replace(temp_meta, meta_file)
+    except OSError as e:
+        logging.warning(f"Could not cache parsed data for {path}: {str(e)}")
+        for temp_file in temp_files:
+            Path(temp_file).unlink(missing_ok=True)
+    return table
+
+def _index_by_employee(df):
+    """
+    Index a frame by EmployeeID in sorted order.
+    
+    Joining two sorted, unique indexes lets pandas use its linear merge-join path
+    rather than building a hash table. Exports are usually already in ID order,
+    so the O(n) monotonic check lets those skip the sort entirely; otherwise a
+    stable mergesort is used.
+    
+    Args:
+        df (pandas.DataFrame): Frame with an EmployeeID column
+        
+    Returns:
+        pandas.DataFrame: The frame indexed and sorted by EmployeeID
+    """
+    df = df.set_index("EmployeeID")
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="mergesort")
+    return df
+
+def _write_sheet(workbook, sheet_name, df):
+    """
+    Write a DataFrame to a new xlsxwriter worksheet one row at a time.
+    
+    Rows are written in order so the sheet works with constant_memory workbooks.
+    Missing values are written as blank cells.
+    
+    Args:
+        workbook (xlsxwriter.Workbook): Workbook to add the worksheet to
+        sheet_name (str): Name of the new worksheet
+        df (pandas.DataFrame): Data to write, with the column names as the header row
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(col) for col in df.columns], workbook.add_format({"bold": True}))
+    for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_idx, 0, [None if pd.isna(value) else value for value in row])
+
 class PayrollAuditor:
     """
     PayrollAuditor performs detailed reconciliation between HR and Payroll systems.
@@ -34,7 +383,8 @@ class PayrollAuditor:
     HR and Payroll systems, identifying discrepancies and generating comprehensive reports.
     """
     
-    def __init__(self, hr_file, payroll_file, output_dir="output"):
+    def __init__(self, hr_file, payroll_file, output_dir="output", chunksize=None, backend="pandas",
+                 use_cache=False, use_gpu=False):
         """
         Initialize PayrollAuditor with input files and output directory.
         
@@ -42,149 +392,544 @@ class PayrollAuditor:
             hr_file (str): Path to the HR system data CSV file
             payroll_file (str): Path to the Payroll system data CSV file
             output_dir (str): Directory where output reports will be saved
+            chunksize (int): Number of Payroll rows to stream per chunk during reconciliation.
+                If None, the whole Payroll file is loaded into memory. Pandas backend only.
+            backend (str): Engine used for loading and reconciliation, "pandas" or "polars"
+            use_cache (bool): Cache parsed CSVs as uncompressed Arrow IPC files next to the
+                inputs and reuse them while the CSV modification time and size are unchanged.
+                Off by default, since the cache is a plain copy of the HR and Payroll data.
+            use_gpu (bool): Load and reconcile on the GPU with cuDF when a CUDA device is
+                available. Falls back to the selected backend with a warning otherwise.
         """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+        if backend == "polars" and not POLARS_AVAILABLE:
+            raise ImportError("The polars backend requires the polars package")
+        if use_gpu:
+            if _cuda_available():
+                backend = "cudf"
+            else:
+                logging.warning(f"cuDF or a CUDA device is not available, using the {backend} backend")
+            
         self.hr_file = hr_file
         self.payroll_file = payroll_file
+        self.chunksize = chunksize
+        self.backend = backend
+        self.use_cache = use_cache
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         self.audit_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.mode = "full"
+        
+        # Reconciliation results are kept as one frame plus row positions into it;
+        # the mismatch and missing-record frames are only materialized on access
+        self._merged = None
+        self._results = None
+        self._mismatch_rows = None
+        self._missing_in_hr_rows = None
+        self._missing_in_payroll_rows = None
+        
+    @property
+    def merged(self):
+        """
+        pandas.DataFrame: Full outer join of HR and Payroll data, indexed by EmployeeID.
+        
+        None before reconciliation and after chunked reconciliation, which never builds
+        the full join. Polars and cuDF joins are converted to pandas on first access.
+        """
+        if self._merged is not None and not isinstance(self._merged, pd.DataFrame):
+            self._merged = self._merged.to_pandas().set_index("EmployeeID")
+        return self._merged
+        
+    @property
+    def mismatches(self):
+        """pandas.DataFrame: Records present in both systems whose pay differs"""
+        if self._results is None:
+            return None
+        return self._results.iloc[self._mismatch_rows]
+        
+    @property
+    def missing_in_hr(self):
+        """pandas.DataFrame: Records present in Payroll but missing in HR"""
+        if self._results is None:
+            return None
+        return self._results.iloc[self._missing_in_hr_rows]
+        
+    @property
+    def missing_in_payroll(self):
+        """pandas.DataFrame: Records present in HR but missing in Payroll"""
+        if self._results is None:
+            return None
+        return self._results.iloc[self._missing_in_payroll_rows]
         
     def load_and_validate_data(self):
         """
         Load CSV files and perform initial data validation.
         
-        Validates that all required columns are present and converts date fields
-        to the appropriate format.
+        Reads both files with PyArrow's multithreaded CSV reader using an explicit
+        schema, so date fields are parsed during the read. Validates that all
+        required columns are present before converting to pandas. When a chunksize
+        is set, only the Payroll header is validated here and the rows are streamed
+        during reconciliation. The polars and cuDF backends load their own DataFrames
+        instead.
         
         Returns:
             bool: True if data loading and validation was successful, False otherwise
         """
         try:
-            self.hr_data = pd.read_csv(self.hr_file)
-            self.payroll_data = pd.read_csv(self.payroll_file)
-            
-            # Validate required columns
-            required_columns = ["EmployeeID", "Pay", "Position", "Department", "PayPeriodEnd"]
-            for df, name in [(self.hr_data, "HR"), (self.payroll_data, "Payroll")]:
-                missing_cols = [col for col in required_columns if col not in df.columns]
-                if missing_cols:
-                    raise ValueError(f"Missing required columns in {name} data: {missing_cols}")
-                    
-            # Convert PayPeriodEnd to datetime
-            for df in [self.hr_data, self.payroll_data]:
-                df["PayPeriodEnd"] = pd.to_datetime(df["PayPeriodEnd"])
+            if self.backend == "polars":
+                self._load_with_polars()
+            elif self.backend == "cudf":
+                self._load_with_cudf()
+            else:
+                self._load_with_pyarrow()
                 
             logging.info("Data loaded and validated successfully")
             return True
             
         except Exception as e:
-            logging.error(f"Error loading data: {str(e)}")
+            logging.exception(f"Error loading data: {str(e)}")
             return False
 
-    def perform_reconciliation(self):
+    def _load_with_pyarrow(self):
+        """
+        Load both CSV files with PyArrow into EmployeeID-indexed pandas frames.
+        """
+        read_options = pacsv.ReadOptions(use_threads=True, block_size=32 << 20)
+        convert_options = pacsv.ConvertOptions(
+            column_types=CSV_COLUMN_TYPES,
+            timestamp_parsers=["%Y-%m-%d"]
+        )
+        
+        sources = [(self.hr_file, "HR")]
+        if self.chunksize is None:
+            sources.append((self.payroll_file, "Payroll"))
+        else:
+            _validate(pd.read_csv(self.payroll_file, nrows=0).columns, "Payroll")
+        
+        frames = {}
+        for path, name in sources:
+            if self.use_cache:
+                table = _read_csv_cached(path, read_options, convert_options)
+            else:
+                table = pacsv.read_csv(path, read_options=read_options, convert_options=convert_options)
+            
+            # Validate required columns before converting to pandas
+            _validate(table.schema.names, name)
+                
+            # PayPeriodEnd is parsed as a timestamp by the reader, no pd.to_datetime pass needed
+            frames[name] = table.to_pandas(self_destruct=True, zero_copy_only=False)
+            
+        # Key both frames by a sorted EmployeeID index so reconciliation can use
+        # pandas' index-aligned join instead of re-hashing the key column each run
+        self.hr_data = _index_by_employee(frames["HR"])
+        self.payroll_data = None
+        if "Payroll" in frames:
+            self.payroll_data = _index_by_employee(frames["Payroll"])
+
+    def _load_with_polars(self):
+        """
+        Load both CSV files as polars DataFrames for the polars backend.
+        """
+        import polars as pl
+        
+        frames = {}
+        for path, name in [(self.hr_file, "HR"), (self.payroll_file, "Payroll")]:
+            df = pl.read_csv(path, try_parse_dates=True, schema_overrides={"EmployeeID": pl.Utf8, "Pay": pl.Float64})
+            _validate(df.columns, name)
+            frames[name] = df
+            
+        self.hr_data = frames["HR"]
+        self.payroll_data = frames["Payroll"]
+
+    def _load_with_cudf(self):
+        """
+        Load both CSV files into GPU memory as cuDF DataFrames.
+        """
+        import cudf
+        
+        frames = {}
+        for path, name in [(self.hr_file, "HR"), (self.payroll_file, "Payroll")]:
+            df = cudf.read_csv(path, dtype={"EmployeeID": "str", "Pay": "float64"}, parse_dates=["PayPeriodEnd"])
+            _validate(df.columns, name)
+            frames[name] = df
+            
+        self.hr_data = frames["HR"]
+        self.payroll_data = frames["Payroll"]
+
+    def perform_reconciliation(self, mode="full"):
         """
         Perform comprehensive payroll reconciliation with detailed analysis.
         
         Merges HR and Payroll data to identify discrepancies, missing records,
         and perform department-level analysis.
         
+        Args:
+            mode (str): "full" builds the discrepancy and department tables. "summary"
+                only computes the statistics and department discrepancy count needed for
+                the JSON summary, and generate_reports then writes only that file. The
+                in-memory pandas path skips the tables entirely in summary mode.
+        
         Returns:
             bool: True if reconciliation was successful, False otherwise
         """
         try:
-            # Merge datasets
-            merged_data = pd.merge(
-                self.hr_data,
-                self.payroll_data,
-                on="EmployeeID",
-                how="outer",
-                suffixes=("_HR", "_Payroll")
-            )
+            if mode not in RECONCILIATION_MODES:
+                raise ValueError(f"Unknown mode {mode!r}, expected one of {RECONCILIATION_MODES}")
+            self.mode = mode
+            
+            if self.backend == "polars":
+                self._reconcile_with_polars()
+            elif self.backend == "cudf":
+                self._reconcile_with_cudf()
+            elif self.chunksize is not None:
+                self._reconcile_in_chunks()
+            else:
+                self._reconcile_in_memory()
+                
+            if self.dept_analysis is not None:
+                self.departments_with_discrepancies = int((self.dept_analysis["Discrepancy"] > 0).sum())
+            
+            logging.info("Reconciliation completed successfully: " + json.dumps({
+                "backend": self.backend,
+                "mode": self.mode,
+                "statistics": self.stats,
+                "departments_with_discrepancies": self.departments_with_discrepancies
+            }))
+            return True
 
-            # Identify discrepancies
-            self.mismatches = merged_data[
-                (merged_data["Pay_HR"].notna()) &
-                (merged_data["Pay_Payroll"].notna()) &
-                (abs(merged_data["Pay_HR"] - merged_data["Pay_Payroll"]) > 0.01)  # Account for floating point differences
-            ]
+        except Exception as e:
+            logging.exception(f"Error during reconciliation: {str(e)}")
+            return False
 
-            # Identify missing records
-            self.missing_in_payroll = merged_data[merged_data["Pay_Payroll"].isna()]
-            self.missing_in_hr = merged_data[merged_data["Pay_HR"].isna()]
+    def _reconcile_in_memory(self):
+        """
+        Reconcile the fully loaded HR and Payroll frames with an outer index join.
+        """
+        # Merge datasets on the shared EmployeeID index
+        merged_data = self.hr_data.join(
+            self.payroll_data,
+            how="outer",
+            lsuffix="_HR",
+            rsuffix="_Payroll"
+        )
 
-            # Calculate statistics
+        # Single fused pass over the two Pay columns: the null masks and the
+        # absolute difference are computed once and reused for every result below
+        pay = merged_data[["Pay_HR", "Pay_Payroll"]].to_numpy(dtype=np.float64)
+        mismatch_mask, hr_missing, payroll_missing, _, total_discrepancy = _reconcile_pay(pay)
+        self._merged = merged_data
+        
+        if self.mode == "summary":
             self.stats = {
                 "total_records": len(merged_data),
-                "mismatches": len(self.mismatches),
-                "missing_in_payroll": len(self.missing_in_payroll),
-                "missing_in_hr": len(self.missing_in_hr),
-                "total_discrepancy_amount": abs(self.mismatches["Pay_HR"] - self.mismatches["Pay_Payroll"]).sum()
+                "mismatches": int(np.count_nonzero(mismatch_mask)),
+                "missing_in_payroll": int(np.count_nonzero(payroll_missing)),
+                "missing_in_hr": int(np.count_nonzero(hr_missing)),
+                "total_discrepancy_amount": float(total_discrepancy)
             }
+            self._results = None
+            self.dept_analysis = None
+            self.departments_with_discrepancies = _department_discrepancy_count(
+                merged_data["Department_HR"], pay[:, 0], pay[:, 1]
+            )
+            return
+
+        # Identify discrepancies and missing records as row positions into the merged frame
+        self._results = merged_data
+        self._mismatch_rows = np.flatnonzero(mismatch_mask)
+        self._missing_in_hr_rows = np.flatnonzero(hr_missing)
+        self._missing_in_payroll_rows = np.flatnonzero(payroll_missing)
 
-            # Department-wise analysis
-            self.dept_analysis = merged_data[merged_data["Department_HR"].notna()].groupby("Department_HR").agg({
-                "EmployeeID": "count",
-                "Pay_HR": "sum",
-                "Pay_Payroll": "sum"
-            }).reset_index()
+        # Calculate statistics
+        self.stats = {
+            "total_records": len(merged_data),
+            "mismatches": len(self._mismatch_rows),
+            "missing_in_payroll": len(self._missing_in_payroll_rows),
+            "missing_in_hr": len(self._missing_in_hr_rows),
+            "total_discrepancy_amount": float(total_discrepancy)
+        }
+
+        self.dept_analysis = _department_analysis(merged_data["Department_HR"], pay[:, 0], pay[:, 1])
+
+    def _reconcile_with_polars(self):
+        """
+        Reconcile with polars' multithreaded hash join and group_by.
+        
+        Only the flagged records are converted to an EmployeeID-indexed pandas frame,
+        with the same columns the pandas backend produces.
+        """
+        import polars as pl
+        
+        hr, payroll = self.hr_data, self.payroll_data
+        
+        # Apply the _HR/_Payroll suffixes up front so the joined columns match pandas
+        shared = [col for col in hr.columns if col in payroll.columns and col != "EmployeeID"]
+        hr = hr.rename({col: f"{col}_HR" for col in shared})
+        payroll = payroll.rename({col: f"{col}_Payroll" for col in shared})
+        merged = hr.join(payroll, on="EmployeeID", how="full", coalesce=True)
+        
+        hr_pay, payroll_pay = pl.col("Pay_HR"), pl.col("Pay_Payroll")
+        hr_cents = (hr_pay * 100).round().cast(pl.Int64)
+        payroll_cents = (payroll_pay * 100).round().cast(pl.Int64)
+        diff_cents = hr_cents - payroll_cents
+        flags = ["_mismatch", "_missing_in_hr", "_missing_in_payroll"]
+        flagged = (
+            merged.with_columns(
+                (hr_pay.is_not_null() & payroll_pay.is_not_null() & (diff_cents != 0)).alias("_mismatch"),
+                hr_pay.is_null().alias("_missing_in_hr"),
+                payroll_pay.is_null().alias("_missing_in_payroll")
+            )
+            .filter(pl.any_horizontal(flags))
+            .sort("EmployeeID")
+        )
+        total_discrepancy = (flagged.filter(pl.col("_mismatch")).select(diff_cents.abs().sum()).item() or 0) / 100.0
+        
+        dept_analysis = (
+            merged.filter(pl.col("Department_HR").is_not_null())
+            .group_by("Department_HR")
+            .agg(pl.len().alias("EmployeeID"), hr_cents.fill_null(0).sum(), payroll_cents.fill_null(0).sum())
+            .with_columns((hr_pay - payroll_pay).abs().alias("Discrepancy"))
+            .with_columns((pl.col(["Pay_HR", "Pay_Payroll", "Discrepancy"]) / 100.0))
+            .sort("Department_HR")
+        )
+        
+        flag_values = flagged.select(flags).to_numpy()
+        self._merged = merged
+        self._results = flagged.drop(flags).to_pandas().set_index("EmployeeID")
+        self._mismatch_rows = np.flatnonzero(flag_values[:, 0])
+        self._missing_in_hr_rows = np.flatnonzero(flag_values[:, 1])
+        self._missing_in_payroll_rows = np.flatnonzero(flag_values[:, 2])
+        
+        self.stats = {
+            "total_records": merged.height,
+            "mismatches": len(self._mismatch_rows),
+            "missing_in_payroll": len(self._missing_in_payroll_rows),
+            "missing_in_hr": len(self._missing_in_hr_rows),
+            "total_discrepancy_amount": float(total_discrepancy)
+        }
+        
+        self.dept_analysis = dept_analysis.to_pandas()
+
+    def _reconcile_with_cudf(self):
+        """
+        Reconcile on the GPU with cuDF's merge and groupby.
+        
+        The join, pay comparison and department totals all run in device memory;
+        only the flagged records and the department table are copied back to the
+        host, with the same columns the pandas backend produces.
+        """
+        import cudf
+        
+        merged = cudf.merge(
+            self.hr_data,
+            self.payroll_data,
+            on="EmployeeID",
+            how="outer",
+            suffixes=("_HR", "_Payroll")
+        )
+        
+        hr_pay, payroll_pay = merged["Pay_HR"], merged["Pay_Payroll"]
+        merged["_hr_cents"] = (hr_pay * 100).round().astype("int64")
+        merged["_payroll_cents"] = (payroll_pay * 100).round().astype("int64")
+        diff_cents = merged["_hr_cents"] - merged["_payroll_cents"]
+        merged["_missing_in_hr"] = hr_pay.isna()
+        merged["_missing_in_payroll"] = payroll_pay.isna()
+        merged["_mismatch"] = (diff_cents != 0).fillna(False) & ~merged["_missing_in_hr"] & ~merged["_missing_in_payroll"]
+        total_discrepancy = (diff_cents.abs()[merged["_mismatch"]].sum() or 0) / 100.0
+        
+        dept_analysis = (
+            merged[merged["Department_HR"].notna()]
+            .groupby("Department_HR", sort=True)
+            .agg({"EmployeeID": "count", "_hr_cents": "sum", "_payroll_cents": "sum"})
+            .reset_index()
+        )
+        dept_analysis["Pay_HR"] = dept_analysis["_hr_cents"] / 100.0
+        dept_analysis["Pay_Payroll"] = dept_analysis["_payroll_cents"] / 100.0
+        dept_analysis["Discrepancy"] = (dept_analysis["_hr_cents"] - dept_analysis["_payroll_cents"]).abs() / 100.0
+        dept_analysis = dept_analysis.drop(columns=["_hr_cents", "_payroll_cents"])
+        
+        flags = ["_mismatch", "_missing_in_hr", "_missing_in_payroll"]
+        flagged = merged[merged["_mismatch"] | merged["_missing_in_hr"] | merged["_missing_in_payroll"]]
+        flagged = flagged.sort_values("EmployeeID").to_pandas()
+        flag_values = flagged[flags].to_numpy(dtype=bool)
+        helpers = flags + ["_hr_cents", "_payroll_cents"]
+        self._merged = merged.drop(columns=helpers)
+        self._results = flagged.drop(columns=helpers).set_index("EmployeeID")
+        self._mismatch_rows = np.flatnonzero(flag_values[:, 0])
+        self._missing_in_hr_rows = np.flatnonzero(flag_values[:, 1])
+        self._missing_in_payroll_rows = np.flatnonzero(flag_values[:, 2])
+        
+        self.stats = {
+            "total_records": len(merged),
+            "mismatches": len(self._mismatch_rows),
+            "missing_in_payroll": len(self._missing_in_payroll_rows),
+            "missing_in_hr": len(self._missing_in_hr_rows),
+            "total_discrepancy_amount": float(total_discrepancy)
+        }
+        
+        self.dept_analysis = dept_analysis.to_pandas()
+
+    def _reconcile_in_chunks(self):
+        """
+        Reconcile by streaming the Payroll file against the in-memory HR data.
+        
+        Each Payroll chunk is matched to HR records by index position, so peak memory
+        stays at one chunk plus the HR data. Only mismatched and missing records are
+        kept, with the same columns an outer join would produce.
+        
+        Raises:
+            ValueError: If an EmployeeID appears more than once in either file
+        """
+        if not self.hr_data.index.is_unique:
+            duplicates = self.hr_data.index[self.hr_data.index.duplicated()].unique()
+            raise ValueError(f"Duplicate EmployeeIDs in HR data: {', '.join(map(str, duplicates[:10]))}")
+        
+        hr_pay = self.hr_data["Pay"].to_numpy(dtype=np.float64)
+        matched_payroll_pay = np.full(len(self.hr_data), np.nan)
+        matched = np.zeros(len(self.hr_data), dtype=bool)
+        unmatched_ids = set()
+        result_chunks = []
+        flag_chunks = []
+        total_discrepancy_cents = 0
+        payroll_template = None
+        
+        for chunk in pd.read_csv(
+            self.payroll_file,
+            chunksize=self.chunksize,
+            dtype={"EmployeeID": "string", "Pay": "float64"},
+            parse_dates=["PayPeriodEnd"]
+        ):
+            chunk = chunk.set_index("EmployeeID")
+            payroll_template = chunk.iloc[:0]
             
-            self.dept_analysis["Discrepancy"] = abs(self.dept_analysis["Pay_HR"] - self.dept_analysis["Pay_Payroll"])
+            # Position of each Payroll record in the HR data, -1 where it is not in HR
+            positions = self.hr_data.index.get_indexer(chunk.index)
+            in_hr = positions >= 0
             
-            logging.info("Reconciliation completed successfully")
-            return True
-
-        except Exception as e:
-            logging.error(f"Error during reconciliation: {str(e)}")
-            return False
+            # An ID repeated within or across chunks would silently overwrite its match
+            duplicates = chunk.index[chunk.index.duplicated()]
+            duplicates = duplicates.append(chunk.index[in_hr][matched[positions[in_hr]]])
+            duplicates = duplicates.append(chunk.index[~in_hr][chunk.index[~in_hr].isin(unmatched_ids)])
+            if len(duplicates):
+                raise ValueError(f"Duplicate EmployeeIDs in Payroll data: {', '.join(map(str, duplicates.unique()[:10]))}")
+            matched[positions[in_hr]] = True
+            unmatched_ids.update(chunk.index[~in_hr])
+            
+            chunk_pay = np.column_stack((
+                np.where(in_hr, hr_pay[positions], np.nan),
+                chunk["Pay"].to_numpy(dtype=np.float64)
+            ))
+            matched_payroll_pay[positions[in_hr]] = chunk_pay[in_hr, 1]
+            
+            mismatch_mask, hr_missing, payroll_missing, abs_diff_cents, _ = _reconcile_pay(chunk_pay)
+            total_discrepancy_cents += int(abs_diff_cents.sum(dtype=np.int64))
+            
+            flagged = mismatch_mask | hr_missing | payroll_missing
+            if flagged.any():
+                result_chunks.append(self.hr_data.join(
+                    chunk.iloc[flagged], how="right", lsuffix="_HR", rsuffix="_Payroll"
+                ))
+                flag_chunks.append(np.column_stack((
+                    mismatch_mask[flagged], hr_missing[flagged], payroll_missing[flagged]
+                )))
+        
+        # HR records no Payroll chunk matched; like the outer join, a blank HR Pay
+        # also flags them as missing in HR
+        if payroll_template is None:
+            payroll_template = pd.DataFrame(columns=[col for col in REQUIRED_COLUMNS if col != "EmployeeID"])
+        hr_only = ~matched
+        result_chunks.append(self.hr_data.iloc[hr_only].join(
+            payroll_template, how="left", lsuffix="_HR", rsuffix="_Payroll"
+        ))
+        flag_chunks.append(np.column_stack((
+            np.zeros(hr_only.sum(), dtype=bool),
+            np.isnan(hr_pay[hr_only]),
+            np.ones(hr_only.sum(), dtype=bool)
+        )))
+        
+        results = pd.concat(result_chunks)
+        order = results.index.argsort()
+        flag_values = np.concatenate(flag_chunks)[order]
+        self._results = results.iloc[order]
+        self._mismatch_rows = np.flatnonzero(flag_values[:, 0])
+        self._missing_in_hr_rows = np.flatnonzero(flag_values[:, 1])
+        self._missing_in_payroll_rows = np.flatnonzero(flag_values[:, 2])
+        
+        self.stats = {
+            "total_records": len(self.hr_data) + len(unmatched_ids),
+            "mismatches": len(self._mismatch_rows),
+            "missing_in_payroll": len(self._missing_in_payroll_rows),
+            "missing_in_hr": len(self._missing_in_hr_rows),
+            "total_discrepancy_amount": total_discrepancy_cents / 100.0
+        }
+        
+        self.dept_analysis = _department_analysis(self.hr_data["Department"], hr_pay, matched_payroll_pay)
 
-    def generate_reports(self):
+    def generate_reports(self, export_parquet=False):
         """
         Generate comprehensive audit reports.
         
         Creates Excel reports with multiple worksheets for different types of discrepancies
-        and a JSON summary file with key statistics.
+        and a JSON summary file with key statistics. After a summary-mode reconciliation
+        only the JSON summary is written.
         
+        Args:
+            export_parquet (bool): Also save each worksheet as a Parquet file
+            
         Returns:
             bool: True if report generation was successful, False otherwise
         """
         try:
+            summary_file = self.output_dir / f"audit_summary_{self.audit_timestamp}.json"
+            if self.mode == "summary":
+                self._write_summary(summary_file)
+                logging.info(f"Summary report generated successfully: {summary_file}")
+                return True
+                
             output_file = self.output_dir / f"payroll_reconciliation_report_{self.audit_timestamp}.xlsx"
             
-            with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-                # Mismatched Records
-                self.mismatches.to_excel(
-                    writer,
-                    sheet_name="Mismatched Records",
-                    index=False
-                )
-                
-                # Missing Records
-                self.missing_in_hr.to_excel(
-                    writer,
-                    sheet_name="Missing in HR",
-                    index=False
-                )
-                self.missing_in_payroll.to_excel(
-                    writer,
-                    sheet_name="Missing in Payroll",
-                    index=False
-                )
+            sheets = [
+                ("Mismatched Records", "mismatches", self.mismatches.reset_index()),
+                ("Missing in HR", "missing_hr", self.missing_in_hr.reset_index()),
+                ("Missing in Payroll", "missing_payroll", self.missing_in_payroll.reset_index()),
+                ("Department Analysis", "dept_analysis", self.dept_analysis)
+            ]
+            
+            # When requested, each sheet is also saved as a compressed Parquet file so
+            # consumers can load one table without parsing the workbook. The Parquet writes
+            # run on worker threads while the workbook is built, since pyarrow releases the GIL.
+            with ThreadPoolExecutor(max_workers=len(sheets)) as executor:
+                parquet_writes = [
+                    executor.submit(
+                        df.to_parquet,
+                        self.output_dir / f"{name}_{self.audit_timestamp}.parquet",
+                        compression="zstd",
+                        index=False
+                    )
+                    for _, name, df in sheets
+                ] if export_parquet else []
                 
-                # Department Analysis
-                self.dept_analysis.to_excel(
-                    writer,
-                    sheet_name="Department Analysis",
-                    index=False
-                )
+                # constant_memory streams each row to disk as it is written instead of
+                # keeping the whole workbook in memory; rows must be written in order,
+                # so the sheets are written with write_row rather than DataFrame.to_excel
+                with pd.ExcelWriter(
+                    output_file,
+                    engine="xlsxwriter",
+                    engine_kwargs={"options": {
+                        "constant_memory": True,
+                        "strings_to_urls": False,
+                        "default_date_format": "yyyy-mm-dd"
+                    }}
+                ) as writer:
+                    for sheet_name, _, df in sheets:
+                        _write_sheet(writer.book, sheet_name, df)
+                        
+                for future in parquet_writes:
+                    future.result()
 
             # Generate JSON summary
-            summary_file = self.output_dir / f"audit_summary_{self.audit_timestamp}.json"
-            with open(summary_file, "w") as f:
-                json.dump({
-                    "audit_date": self.audit_timestamp,
-                    "statistics": self.stats,
-                    "departments_with_discrepancies": len(self.dept_analysis[self.dept_analysis["Discrepancy"] > 0])
-                }, f, indent=4)
+            self._write_summary(summary_file)
 
             logging.info(f"Reports generated successfully: {output_file}")
             return True
@@ -192,6 +937,20 @@ class PayrollAuditor:
         except Exception as e:
             logging.error(f"Error generating reports: {str(e)}")
             return False
+            
+    def _write_summary(self, summary_file):
+        """
+        Write the JSON summary of the reconciliation statistics.
+        
+        Args:
+            summary_file (pathlib.Path): Destination of the JSON summary
+        """
+        with open(summary_file, "w") as f:
+            json.dump({
+                "audit_date": self.audit_timestamp,
+                "statistics": self.stats,
+                "departments_with_discrepancies": self.departments_with_discrepancies
+            }, f, indent=4)
 
 def main():
     """